@@ -13,18 +13,32 @@ Features:
 """
 
 import asyncio
+import bisect
+import itertools
 import json
 import logging
 import random
-import urllib.request
-import urllib.error
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
-from dataclasses import dataclass
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import httpx
+
+# Fast JSON when orjson is installed; stdlib fallback keeps the module importable
+try:
+    import orjson
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    _json_loads = json.loads
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Logging is configured by the entry point (main() / main.py), not at import
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -40,30 +54,111 @@ class FailureType(Enum):
     SERVICE = "service"
     INTEGRATION = "integration"
 
+# Integer failure-type codes for hot-path dispatch (FailureType definition order)
+DB_CODE, NET_CODE, RES_CODE, SEC_CODE, SVC_CODE, INT_CODE = range(6)
+_TYPE_CODES = {failure_type: code for code, failure_type in enumerate(FailureType)}
+
 class Severity(Enum):
     """Event severity levels."""
     CRITICAL = "critical"
     WARNING = "warning"
     INFO = "info"
 
-@dataclass
+# Shared severity strings (the enum value objects themselves) for hot-path lookups and comparisons
+CRITICAL, WARNING, INFO = (severity.value for severity in Severity)
+
+# Synthetic source addresses sampled by index (4096 distinct 192.168.x.y hosts)
+_IP_POOL = tuple(f"192.168.{a}.{b}" for a in range(1, 256, 4) for b in range(1, 256, 4))
+
+# Literal choice pools shared by message and detail generation
+_DB_TABLES = ("users", "orders", "sessions", "products")
+_NET_TARGETS = ("payment-api", "user-service", "auth-gateway")
+_SEC_SOURCES = ("10.0.0.0/8", "suspicious-host.com")
+_USER_BUCKETS = (40, 120, 400, 1200, 4000)
+_DB_TYPES = ("PostgreSQL", "MySQL", "MongoDB", "Redis")
+_POOL_SIZES = (10, 20, 50, 100)
+_NET_ERROR_CODES = ("CONN_REFUSED", "TIMEOUT", "DNS_FAILURE", "SSL_ERROR")
+_MEM_TOTALS = (2, 4, 8, 16, 32)
+_AUTH_METHODS = ("password", "token", "oauth", "api_key")
+
+# Per-type message value draws, in template placeholder order
+_DB_DRAWS = (
+    lambda rng: rng.randint(15, 100),  # connections
+    lambda rng: rng.randint(20, 100),  # max connections
+    lambda rng: rng.randint(500, 8000),  # timeout ms
+    lambda rng: rng.choice(_DB_TABLES)  # table
+)
+_NET_DRAWS = (
+    lambda rng: rng.choice(_NET_TARGETS),  # service
+    lambda rng: rng.randint(3, 10),  # failure count
+    lambda rng: rng.randint(1000, 30000),  # timeout ms
+    lambda rng: rng.randint(15, 85)  # error rate %
+)
+_SEC_DRAWS = (
+    lambda rng: rng.randint(15, 85),  # percentage
+    lambda rng: rng.choice(_IP_POOL),  # IP
+    lambda rng: rng.randint(50, 500),  # attempts
+    lambda rng: rng.choice(_SEC_SOURCES)  # source
+)
+_GENERIC_DRAWS = (
+    lambda rng: rng.randint(75, 95),  # usage %
+    lambda rng: rng.randint(4, 32),  # GB/cores
+    lambda rng: rng.randint(100, 2000),  # rate/count
+    lambda rng: rng.randint(200, 1000)  # threshold
+)
+
+@dataclass(frozen=True, slots=True)
 class FailureScenario:
     """Template for generating failure events."""
     scenario_id: str
     failure_type: FailureType
     base_severity: Severity
-    service_pool: List[str]
+    service_pool: Tuple[str, ...]
     message_templates: List[str]
     probability_weight: float = 1.0
+    value_draws: Tuple[Callable[[random.Random], Any], ...] = _GENERIC_DRAWS
+    templates: Tuple[Tuple[str, Tuple[Callable[[random.Random], Any], ...]], ...] = field(init=False)
+    failure_type_code: int = field(init=False)
+    failure_type_str: str = field(init=False)
+    
+    def __post_init__(self):
+        """Pair each message template with exactly the value draws it needs and cache failure-type lookups."""
+        # Frozen instance - derived fields are set once through object.__setattr__
+        object.__setattr__(self, "templates", tuple((t, self.value_draws[:t.count('{}')]) for t in self.message_templates))
+        object.__setattr__(self, "failure_type_code", _TYPE_CODES[self.failure_type])
+        object.__setattr__(self, "failure_type_str", self.failure_type.value)
+    
+    def with_weight(self, weight: float) -> "FailureScenario":
+        """Return a copy of this scenario with a different base probability weight."""
+        return replace(self, probability_weight=weight)
 
 # Enhanced service pools with realistic names
 SERVICES = {
-    "data": ["user-db", "order-db", "analytics-db", "cache-redis", "search-elastic"],
-    "api": ["user-api", "order-api", "payment-api", "notification-api", "auth-service"],
-    "infra": ["load-balancer", "api-gateway", "message-queue", "file-storage", "cdn"],
-    "external": ["payment-processor", "email-service", "sms-gateway", "monitoring-api"]
+    "data": ("user-db", "order-db", "analytics-db", "cache-redis", "search-elastic"),
+    "api": ("user-api", "order-api", "payment-api", "notification-api", "auth-service"),
+    "infra": ("load-balancer", "api-gateway", "message-queue", "file-storage", "cdn"),
+    "external": ("payment-processor", "email-service", "sms-gateway", "monitoring-api")
+}
+
+# Event timing variance (mostly current) and severity escalation odds
+TIME_OFFSETS = (0, 0, 0, 0, 15, 30, 120)
+# UTC ISO-8601 with explicit Z suffix, for event timestamps
+_ISO_UTC = "%Y-%m-%dT%H:%M:%S.%fZ"
+ESCALATION_CHANCE = 0.15
+# How long a successful health check is trusted before the agent is probed again
+HEALTH_CACHE_SECONDS = 5.0
+# (severity, failure-type code) -> escalated severity; pairs not listed stay as-is
+_ESCALATIONS = {
+    (WARNING, DB_CODE): CRITICAL,
+    (WARNING, SEC_CODE): CRITICAL,
+    **{(INFO, code): WARNING for code in _TYPE_CODES.values()}
 }
 
+# Combined pools shared by scenarios (built once at import)
+_API_EXT = SERVICES["api"] + SERVICES["external"]
+_API_INFRA = SERVICES["api"] + SERVICES["infra"]
+_EXT_INFRA = SERVICES["external"] + SERVICES["infra"]
+
 # =============================================================================
 # PROBLEM MAKER
 # =============================================================================
@@ -76,15 +171,35 @@ class ChaosAgent:
     while maintaining lean, efficient architecture.
     """
     
-    def __init__(self, agent_url: str = "http://localhost:8001"):
+    def __init__(self, agent_url: str = "http://localhost:8001", max_in_flight: int = 8, full_details: bool = False,
+                 seed: Optional[int] = None):
         """Initialize Problem Maker with Signal Agent endpoint."""
         self.agent_url = agent_url.rstrip('/')
         self.events_endpoint = f"{self.agent_url}/events"
+        self.batch_endpoint = f"{self.agent_url}/events/batch"
         self.health_endpoint = f"{self.agent_url}/health"
         
         self.event_counter = 0
         self.running = False
+        self.full_details = full_details
         self.scenarios = self._build_failure_scenarios()
+        # Private RNG instance - skips the module-level wrappers and makes runs reproducible via seed
+        self._rng = random.Random(seed)
+        # (cumulative weights, total) for each time-of-day regime, keyed by is-business-hours
+        self._weight_tables = {
+            business_hours: self._compute_weights(business_hours)
+            for business_hours in (True, False)
+        }
+        self._last_index = len(self.scenarios) - 1
+        # Current time regime, refreshed by _time_regime when the local hour rolls over
+        self._regime = None
+        self._regime_expires = datetime.min.replace(tzinfo=timezone.utc)
+        
+        # Async HTTP client - created lazily so it binds to the running event loop
+        self.max_in_flight = max_in_flight
+        self._client = None
+        self._health_ok_at: Optional[float] = None
+        self._batch_buf: List[Dict[str, Any]] = []
         
     def _build_failure_scenarios(self) -> List[FailureScenario]:
         """Build comprehensive library of realistic failure scenarios."""
@@ -100,7 +215,8 @@ class ChaosAgent:
                     "Database connection timeout after {}ms - pool saturated",
                     "Connection leak detected - {} unclosed connections"
                 ],
-                probability_weight=2.5
+                probability_weight=2.5,
+                value_draws=_DB_DRAWS
             ),
             
             FailureScenario(
@@ -113,7 +229,8 @@ class ChaosAgent:
                     "Slow query on table '{}' - scanning {} rows",
                     "Lock contention detected - {} blocked transactions"
                 ],
-                probability_weight=2.0
+                probability_weight=2.0,
+                value_draws=_DB_DRAWS
             ),
             
             # Network Issues
@@ -121,13 +238,14 @@ class ChaosAgent:
                 scenario_id="service_connectivity",
                 failure_type=FailureType.NETWORK,
                 base_severity=Severity.CRITICAL,
-                service_pool=SERVICES["api"] + SERVICES["external"],
+                service_pool=_API_EXT,
                 message_templates=[
                     "Service {} unreachable - {} consecutive failures",
                     "Circuit breaker opened for {} after {}% error rate",
                     "Upstream timeout from {} - {}ms exceeded"
                 ],
-                probability_weight=2.2
+                probability_weight=2.2,
+                value_draws=_NET_DRAWS
             ),
             
             # Resource Issues
@@ -135,13 +253,14 @@ class ChaosAgent:
                 scenario_id="resource_exhaustion",
                 failure_type=FailureType.RESOURCE,
                 base_severity=Severity.WARNING,
-                service_pool=SERVICES["api"] + SERVICES["infra"],
+                service_pool=_API_INFRA,
                 message_templates=[
                     "Memory usage critical - {}% of {} GB allocated",
                     "CPU throttling active - {}% sustained load",
                     "Rate limit exceeded - {} req/sec over {} limit"
                 ],
-                probability_weight=1.8
+                probability_weight=1.8,
+                value_draws=_GENERIC_DRAWS
             ),
             
             # Security Issues
@@ -155,7 +274,8 @@ class ChaosAgent:
                     "Suspicious activity detected - {} failed logins from {}",
                     "Rate limiting aggressive requests - {} attempts blocked"
                 ],
-                probability_weight=1.3
+                probability_weight=1.3,
+                value_draws=_SEC_DRAWS
             ),
             
             # Service Issues
@@ -169,7 +289,8 @@ class ChaosAgent:
                     "Health check failures for {} consecutive attempts",
                     "Service degradation - {}% success rate"
                 ],
-                probability_weight=2.0
+                probability_weight=2.0,
+                value_draws=_GENERIC_DRAWS
             ),
             
             # Integration Issues
@@ -177,163 +298,136 @@ class ChaosAgent:
                 scenario_id="integration_issues",
                 failure_type=FailureType.INTEGRATION,
                 base_severity=Severity.WARNING,
-                service_pool=SERVICES["external"] + SERVICES["infra"],
+                service_pool=_EXT_INFRA,
                 message_templates=[
                     "External service {} returning HTTP {} errors",
                     "Message queue capacity warning - {}% full",
                     "Webhook delivery failures - {} retries exhausted"
                 ],
-                probability_weight=1.5
+                probability_weight=1.5,
+                value_draws=_GENERIC_DRAWS
             )
         ]
     
-    def _generate_enhanced_details(self, scenario: FailureScenario) -> Dict[str, Any]:
-        """Generate enhanced, contextual details for failure events."""
-        # Get time context for realistic patterns
-        now = datetime.now()
-        hour, weekday = now.hour, now.weekday()
-        time_context = "weekend" if weekday >= 5 else ("business_hours" if 9 <= hour <= 17 else "off_hours")
+    def _core_details(self, scenario: FailureScenario, clock: Dict[str, str], extended: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate the base context and common metrics carried by every event, plus any extended fields."""
+        ri, rc, ru = self._rng.randint, self._rng.choice, self._rng.uniform
         
-        # Base details
-        details = {
+        return {
             "scenario_type": scenario.scenario_id,
-            "failure_category": scenario.failure_type.value,
-            "generated_at": now.isoformat(),
-            "time_context": time_context,
-            "correlation_id": f"req_{random.randint(100000, 999999)}"
+            "failure_category": scenario.failure_type_str,
+            "generated_at": clock["generated_at"],
+            "time_context": clock["time_context"],
+            "correlation_id": f"req_{ri(100000, 999999)}",
+            "affected_users": rc(_USER_BUCKETS) * ri(1, 2),
+            "error_rate_percent": round(ru(0.5, 25.0), 2),
+            "response_time_p95_ms": ri(100, 5000),
+            **extended
         }
-        
-        # Enhanced scenario-specific details
-        if scenario.failure_type == FailureType.DATABASE:
-            details.update({
-                "database_type": random.choice(["PostgreSQL", "MySQL", "MongoDB", "Redis"]),
-                "connection_pool_size": random.choice([10, 20, 50, 100]),
-                "active_connections": random.randint(5, 150),
-                "query_time_ms": random.randint(100, 10000)
-            })
-        elif scenario.failure_type == FailureType.NETWORK:
-            details.update({
-                "response_time_ms": random.randint(1000, 30000),
-                "retry_attempts": random.randint(1, 5),
-                "error_code": random.choice(["CONN_REFUSED", "TIMEOUT", "DNS_FAILURE", "SSL_ERROR"])
-            })
-        elif scenario.failure_type == FailureType.RESOURCE:
-            details.update({
-                "memory_used_gb": round(random.uniform(1, 16), 2),
-                "memory_total_gb": random.choice([2, 4, 8, 16, 32]),
-                "cpu_percent": round(random.uniform(75, 95), 1)
-            })
-        elif scenario.failure_type == FailureType.SECURITY:
-            details.update({
-                "source_ips": [f"192.168.{random.randint(1,255)}.{random.randint(1,255)}" 
-                              for _ in range(random.randint(1, 3))],
-                "failed_attempts": random.randint(10, 500),
-                "auth_method": random.choice(["password", "token", "oauth", "api_key"])
-            })
-        
-        # Common enhanced metrics
-        details.update({
-            "affected_users": random.choice([40, 120, 400, 1200, 4000]) * random.randint(1, 2),
-            "error_rate_percent": round(random.uniform(0.5, 25.0), 2),
-            "response_time_p95_ms": random.randint(100, 5000)
-        })
-        
-        return details
     
-    def _format_realistic_message(self, template: str, scenario: FailureScenario) -> str:
-        """Format message template with contextually appropriate values."""
-        placeholder_count = template.count('{}')
-        if placeholder_count == 0:
-            return template
+    def _extended_details(self, scenario: FailureScenario) -> Dict[str, Any]:
+        """Generate failure-type specific diagnostics (database, network, resource, security)."""
+        ri, rc, ru = self._rng.randint, self._rng.choice, self._rng.uniform
         
-        # Generate values based on failure type context
-        if scenario.failure_type == FailureType.DATABASE:
-            values = [
-                random.randint(15, 100),  # connections
-                random.randint(20, 100),  # max connections  
-                random.randint(500, 8000),  # timeout ms
-                random.choice(["users", "orders", "sessions", "products"])  # table
-            ]
-        elif scenario.failure_type == FailureType.NETWORK:
-            values = [
-                random.choice(["payment-api", "user-service", "auth-gateway"]),  # service
-                random.randint(3, 10),  # failure count
-                random.randint(1000, 30000),  # timeout ms
-                random.randint(15, 85)  # error rate %
-            ]
-        elif scenario.failure_type == FailureType.SECURITY:
-            values = [
-                random.randint(15, 85),  # percentage
-                f"192.168.{random.randint(1,255)}.{random.randint(1,255)}",  # IP
-                random.randint(50, 500),  # attempts
-                random.choice(["10.0.0.0/8", "suspicious-host.com"])  # source
-            ]
-        else:
-            # Generic realistic values
-            values = [
-                random.randint(75, 95),  # usage %
-                random.randint(4, 32),   # GB/cores
-                random.randint(100, 2000),  # rate/count
-                random.randint(200, 1000)   # threshold
-            ]
+        code = scenario.failure_type_code
         
-        return template.format(*values[:placeholder_count])
+        if code == DB_CODE:
+            return {
+                "database_type": rc(_DB_TYPES),
+                "connection_pool_size": rc(_POOL_SIZES),
+                "active_connections": ri(5, 150),
+                "query_time_ms": ri(100, 10000)
+            }
+        elif code == NET_CODE:
+            return {
+                "response_time_ms": ri(1000, 30000),
+                "retry_attempts": ri(1, 5),
+                "error_code": rc(_NET_ERROR_CODES)
+            }
+        elif code == RES_CODE:
+            return {
+                "memory_used_gb": round(ru(1, 16), 2),
+                "memory_total_gb": rc(_MEM_TOTALS),
+                "cpu_percent": round(ru(75, 95), 1)
+            }
+        elif code == SEC_CODE:
+            return {
+                "source_ips": self._rng.sample(_IP_POOL, k=ri(1, 3)),
+                "failed_attempts": ri(10, 500),
+                "auth_method": rc(_AUTH_METHODS)
+            }
+        return {}
     
-    def generate_event(self) -> Dict[str, Any]:
-        """Generate a single realistic failure event with enhanced metadata."""
-        # Apply time-based probability adjustment
-        current_hour = datetime.now().hour
-        adjusted_scenarios = []
+    def _generate_enhanced_details(self, scenario: FailureScenario, clock: Dict[str, str], severity: str) -> Dict[str, Any]:
+        """
+        Generate contextual details for failure events.
         
-        for scenario in self.scenarios:
-            weight = scenario.probability_weight
-            
-            # Increase database/resource issues during business hours
-            if scenario.failure_type in [FailureType.DATABASE, FailureType.RESOURCE] and 9 <= current_hour <= 17:
-                weight *= 1.5
-            # Increase security issues during off-hours
-            elif scenario.failure_type == FailureType.SECURITY and (current_hour < 9 or current_hour > 17):
-                weight *= 1.8
-                
-            adjusted_scenarios.append((scenario, weight))
+        Failure-type diagnostics are only generated for critical events (or for
+        every event when full_details is enabled); other severities carry the core set.
+        """
+        extended = self._extended_details(scenario) if self.full_details or severity == CRITICAL else {}
+        # Built in a single literal - no follow-up update()/resize
+        return self._core_details(scenario, clock, extended)
+    
+    def _format_realistic_message(self, template: str, draws: Tuple[Callable[[random.Random], Any], ...]) -> str:
+        """Format a placeholder template using its bound, contextually appropriate value draws."""
+        rng = self._rng
+        return template.format(*[draw(rng) for draw in draws])
+    
+    @staticmethod
+    def _adjust_weight(scenario: FailureScenario, business_hours: bool) -> float:
+        """Apply time-of-day bias to a scenario's base probability weight."""
+        weight = scenario.probability_weight
         
-        # Select scenario based on adjusted weights
-        total_weight = sum(w for _, w in adjusted_scenarios)
-        random_val = random.uniform(0, total_weight)
+        # Increase database/resource issues during business hours
+        if scenario.failure_type in [FailureType.DATABASE, FailureType.RESOURCE] and business_hours:
+            weight *= 1.5
+        # Increase security issues during off-hours
+        elif scenario.failure_type == FailureType.SECURITY and not business_hours:
+            weight *= 1.8
         
-        cumulative_weight = 0
-        for scenario, weight in adjusted_scenarios:
-            cumulative_weight += weight
-            if random_val <= cumulative_weight:
-                selected_scenario = scenario
-                break
-        else:
-            selected_scenario = self.scenarios[0]
+        return weight
+    
+    def _compute_weights(self, business_hours: bool) -> Tuple[Tuple[float, ...], float]:
+        """Build the cumulative weight table and its total for one time-of-day regime."""
+        cum_weights = tuple(itertools.accumulate(self._adjust_weight(s, business_hours) for s in self.scenarios))
+        return cum_weights, cum_weights[-1]
+    
+    def _time_regime(self, now: datetime) -> Tuple[Tuple[Tuple[float, ...], float], str]:
+        """
+        Return ((cumulative weights, total), time_context) for `now`.
         
-        # Generate event
+        Both only change on local hour boundaries, so the local-time conversion
+        runs once per hour rather than once per event.
+        """
+        if now >= self._regime_expires:
+            # Time context for realistic patterns (local wall clock)
+            local = now.astimezone()
+            hour, weekday = local.hour, local.weekday()
+            time_context = "weekend" if weekday >= 5 else ("business_hours" if 9 <= hour <= 17 else "off_hours")
+            self._regime = (self._weight_tables[9 <= hour <= 17], time_context)
+            self._regime_expires = local.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        return self._regime
+    
+    def _build_event(self, scenario: FailureScenario, clock: Dict[str, str], timestamp: str, escalate: bool) -> Dict[str, Any]:
+        """Assemble one event from a selected scenario, shared clock fields and pre-drawn timestamp/escalation."""
         self.event_counter += 1
-        # Generate unique event IDs with timestamp
-        timestamp_str = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]  # microseconds to milliseconds
-        event_id = f"{selected_scenario.scenario_id}_{self.event_counter:04d}_{timestamp_str}"
+        # Unique event IDs - counter keeps ordering within the same nanosecond; ISO time lives in "timestamp"
+        event_id = f"{scenario.scenario_id}_{self.event_counter:04d}_{time.time_ns():x}"
         
-        # Realistic timing with slight variance
-        time_offset = random.choice([0, 0, 0, 0, 15, 30, 120])  # Mostly current
-        timestamp = (datetime.now() - timedelta(seconds=time_offset)).isoformat() + "Z"
-        
-        service = random.choice(selected_scenario.service_pool)
+        rchoice = self._rng.choice
+        service = rchoice(scenario.service_pool)
         
         # Smart severity escalation
-        severity = selected_scenario.base_severity.value
-        if random.random() < 0.15:  # 15% escalation chance
-            if severity == "warning" and selected_scenario.failure_type in [FailureType.DATABASE, FailureType.SECURITY]:
-                severity = "critical"
-            elif severity == "info":
-                severity = "warning"
+        severity = scenario.base_severity.value
+        if escalate:
+            severity = _ESCALATIONS.get((severity, scenario.failure_type_code), severity)
         
         # Generate realistic message and details
-        message_template = random.choice(selected_scenario.message_templates)
-        message = self._format_realistic_message(message_template, selected_scenario)
-        details = self._generate_enhanced_details(selected_scenario)
+        template, draws = rchoice(scenario.templates)
+        # Static templates (no placeholders) are used verbatim
+        message = self._format_realistic_message(template, draws) if draws else template
+        details = self._generate_enhanced_details(scenario, clock, severity)
         
         return {
             "event_id": event_id,
@@ -344,55 +438,157 @@ class ChaosAgent:
             "details": details
         }
     
-    def check_agent_health(self) -> bool:
-        """Check if Signal Agent is healthy and ready."""
-        try:
-            req = urllib.request.Request(self.health_endpoint)
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    health_data = json.loads(response.read().decode())
-                    return health_data.get("status") == "healthy" and health_data.get("mcp_connected", False)
-                return False
-        except Exception as e:
-            logger.error(f"❌ Health check error: {str(e)}")
-            return False
+    def generate_event(self) -> Dict[str, Any]:
+        """Generate a single realistic failure event with enhanced metadata."""
+        # Single clock read shared by weighting, IDs, timestamps and details
+        now = datetime.now(timezone.utc)
+        (cum_weights, total), time_context = self._time_regime(now)
+        rng = self._rng
+        
+        # Weighted pick straight off the precomputed table - no per-event list allocation
+        index = bisect.bisect(cum_weights, rng.random() * total, 0, self._last_index)
+        selected_scenario = self.scenarios[index]
+        # Realistic timing with slight variance; the common zero offset reuses generated_at
+        generated_at = now.strftime(_ISO_UTC)
+        offset = rng.choice(TIME_OFFSETS)
+        timestamp = (now - timedelta(seconds=offset)).strftime(_ISO_UTC) if offset else generated_at
+        escalate = rng.random() < ESCALATION_CHANCE
+        
+        return self._build_event(selected_scenario, {"generated_at": generated_at, "time_context": time_context}, timestamp, escalate)
     
-    def send_event_to_agent(self, event: Dict[str, Any]) -> bool:
-        """Send event to Signal Agent via HTTP POST."""
-        try:
-            event_json = json.dumps(event).encode('utf-8')
-            req = urllib.request.Request(
-                self.events_endpoint,
-                data=event_json,
-                headers={'Content-Type': 'application/json'}
+    def generate_events_batch(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Generate n events, drawing scenario, timing and escalation columns up front.
+        
+        Each column is a single C-level choices() call for the whole batch, and
+        clock-derived strings (ISO timestamps, time context) are
+        formatted once per batch, so per-event work is limited to the dict itself.
+        """
+        now = datetime.now(timezone.utc)
+        (cum_weights, _), time_context = self._time_regime(now)
+        stamps = {offset: (now - timedelta(seconds=offset)).strftime(_ISO_UTC) for offset in set(TIME_OFFSETS)}
+        clock = {"generated_at": stamps[0], "time_context": time_context}
+        
+        rchoices = self._rng.choices
+        scenarios = rchoices(self.scenarios, cum_weights=cum_weights, k=n)
+        offsets = rchoices(TIME_OFFSETS, k=n)
+        escalations = rchoices((True, False), cum_weights=(ESCALATION_CHANCE, 1.0), k=n)
+        
+        return [
+            self._build_event(scenario, clock, stamps[offset], escalate)
+            for scenario, offset, escalate in zip(scenarios, offsets, escalations)
+        ]
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared keep-alive client, creating it on first use."""
+        if self._client is None:
+            # Nagle off: back-to-back small POSTs on a reused socket must not wait on delayed ACKs
+            transport = httpx.AsyncHTTPTransport(
+                # Keep every in-flight connection pooled (httpx caps idle keep-alives at 20 by default)
+                limits=httpx.Limits(
+                    max_connections=self.max_in_flight,
+                    max_keepalive_connections=self.max_in_flight,
+                    keepalive_expiry=60
+                ),
+                socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
             )
-            
-            with urllib.request.urlopen(req, timeout=30) as response:
-                if response.status == 200:
-                    result = json.loads(response.read().decode())
-                    if result.get("status") == "processed":
-                        logger.info(f"✅ Event {event['event_id']} processed successfully")
+            self._client = httpx.AsyncClient(transport=transport, timeout=30)
+        return self._client
+    
+    async def check_agent_health(self, retries: int = 4) -> bool:
+        """
+        Check if Signal Agent is healthy and ready.
+        
+        A healthy result is reused for HEALTH_CACHE_SECONDS; failures are retried
+        with exponential backoff (0.5s, 1s, 2s, ...) so startup races are not fatal.
+        """
+        if self._health_ok_at is not None and time.monotonic() - self._health_ok_at < HEALTH_CACHE_SECONDS:
+            return True
+        
+        for attempt in range(retries + 1):
+            if attempt:
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+            try:
+                response = await self._get_client().get(self.health_endpoint, timeout=5)
+                if response.status_code == 200:
+                    health_data = _json_loads(response.content)
+                    if health_data.get("status") == "healthy" and health_data.get("mcp_connected", False):
+                        self._health_ok_at = time.monotonic()
                         return True
-                logger.error(f"❌ Processing failed: {result.get('error', 'Unknown error') if response.status == 200 else f'HTTP {response.status}'}")
-                return False
+            except Exception as e:
+                logger.error("❌ Health check error: %s", e)
+        
+        self._health_ok_at = None
+        return False
+    
+    async def _post_json(self, url: str, payload: Any, label: str) -> Optional[Dict[str, Any]]:
+        """POST a JSON payload; shared response decoding and error logging for all sends."""
+        try:
+            response = await self._get_client().post(url, content=_json_dumps(payload), headers=_JSON_HEADERS)
+            if response.status_code == 200:
+                return _json_loads(response.content)
+            logger.error("❌ Processing failed for %s: HTTP %d", label, response.status_code)
         except Exception as e:
-            logger.error(f"❌ Send error for {event['event_id']}: {str(e)}")
+            logger.error("❌ Send error for %s: %s", label, e)
+        return None
+    
+    async def send_event_to_agent(self, event: Dict[str, Any]) -> bool:
+        """Send event to Signal Agent via HTTP POST."""
+        result = await self._post_json(self.events_endpoint, event, event['event_id'])
+        if result is None:
             return False
+        if result.get("status") == "processed":
+            logger.info("✅ Event %s processed successfully", event['event_id'])
+            return True
+        logger.error("❌ Processing failed: %s", result.get('error', 'Unknown error'))
+        return False
+    
+    async def send_batch_to_agent(self, events: List[Dict[str, Any]]) -> int:
+        """Send several events in one HTTP POST; returns the number processed."""
+        result = await self._post_json(self.batch_endpoint, {"events": events}, f"batch of {len(events)} events")
+        if result is None:
+            return 0
+        processed = result.get("processed", 0)
+        logger.info("✅ Batch of %d events: %d processed", len(events), processed)
+        return processed
     
-    async def generate_problem_stream(self, count: int = 10, delay_seconds: float = 2.0):
-        """Generate stream of failure events and send to Signal Agent."""
-        logger.info(f"Starting problem generation - {count} events, {delay_seconds}s intervals")
+    async def _send_worker(self, queue: asyncio.Queue) -> int:
+        """Drain the send queue until a None sentinel; returns events processed."""
+        sent = 0
+        while True:
+            item = await queue.get()
+            if item is None:
+                return sent
+            if isinstance(item, list):
+                sent += await self.send_batch_to_agent(item)
+            else:
+                sent += await self.send_event_to_agent(item)
+    
+    async def generate_problem_stream(self, count: int = 10, delay_seconds: float = 2.0, batch_size: int = 1):
+        """
+        Generate stream of failure events and send to Signal Agent.
+        
+        Events are produced on a fixed cadence against a monotonic deadline and
+        queued for max_in_flight send workers, so the event rate stays at
+        1/delay regardless of send latency. With batch_size > 1, events are
+        buffered and POSTed to /events/batch once per batch_size events.
+        """
+        logger.info("Starting problem generation - %d events, %ss intervals", count, delay_seconds)
         
         # Health check
         print("Checking Signal Agent health...")
-        if not self.check_agent_health():
+        if not await self.check_agent_health():
             print("Signal Agent not ready. Ensure agent is running with HTTP listener and MCP connected.")
             return
         
         print("✅ Signal Agent ready - starting event generation")
         
         self.running = True
-        successful_sends = 0
+        # Bounded queue gives back-pressure when workers fall behind
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_in_flight * 2)
+        workers = [asyncio.create_task(self._send_worker(queue)) for _ in range(self.max_in_flight)]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         
         for i in range(count):
             if not self.running:
@@ -400,26 +596,45 @@ class ChaosAgent:
             
             event = self.generate_event()
             
-            logger.info(f"🚨 Event {i+1}/{count}: {event['event_id']} - {event['severity']} - {event['service']}")
-            print(f"📡 Sending: {event['message'][:70]}...")
+            # Single line per event - the console handler is the only output path
+            logger.info("🚨 Event %d/%d: %s - %s - %s | 📡 %.70s", i + 1, count,
+                        event['event_id'], event['severity'], event['service'], event['message'])
             
-            if self.send_event_to_agent(event):
-                successful_sends += 1
-                print(f"   ✅ Processed by Signal Agent")
+            if batch_size > 1:
+                self._batch_buf.append(event)
+                if len(self._batch_buf) >= batch_size:
+                    await queue.put(self._batch_buf)
+                    self._batch_buf = []
             else:
-                print(f"   ❌ Failed to process")
+                await queue.put(event)
             
             if i < count - 1:
-                await asyncio.sleep(delay_seconds)
+                deadline += delay_seconds
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
+        
+        # Flush the partial batch (end of stream or stop_generation)
+        if self._batch_buf:
+            await queue.put(self._batch_buf)
+            self._batch_buf = []
+        
+        for _ in workers:
+            await queue.put(None)
+        successful_sends = sum(await asyncio.gather(*workers))
         
         success_rate = (successful_sends / count) * 100 if count > 0 else 0
-        logger.info(f"🎉 Generation complete: {successful_sends}/{count} events ({success_rate:.1f}% success)")
+        logger.info("🎉 Generation complete: %d/%d events (%.1f%% success)", successful_sends, count, success_rate)
         self.running = False
     
     def stop_generation(self):
         """Stop problem generation."""
         self.running = False
         logger.info("🛑 Problem generation stopped")
+    
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 # =============================================================================
 # MAIN ENTRY POINT
@@ -429,41 +644,64 @@ async def main():
     """Main entry point for standalone execution."""
     import argparse
     
+    logging.basicConfig(level=logging.INFO)
+    # httpx logs every request at INFO - one extra line per sent event
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    
     parser = argparse.ArgumentParser(description="Problem Maker - Realistic Failure Event Generator")
     parser.add_argument("--agent-url", default="http://localhost:8001", help="Signal Agent endpoint")
     parser.add_argument("--count", type=int, default=10, help="Number of events to generate")
     parser.add_argument("--delay", type=float, default=2.0, help="Delay between events (seconds)")
+    parser.add_argument("--batch-size", type=int, default=1, help="Events per POST (>1 uses /events/batch)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum sends in flight")
     parser.add_argument("--demo", action="store_true", help="Show sample events without sending")
     parser.add_argument("--health", action="store_true", help="Check Agent health and exit")
+    parser.add_argument("--benchmark", action="store_true", help="Time local generation of --count events without sending")
+    parser.add_argument("--full-details", action="store_true", help="Include type-specific diagnostics on every event, not just critical ones")
+    parser.add_argument("--seed", type=int, help="Seed the event RNG for reproducible runs")
     
     args = parser.parse_args()
-    problem_maker = ChaosAgent(agent_url=args.agent_url)
+    problem_maker = ChaosAgent(
+        agent_url=args.agent_url,
+        max_in_flight=max(1, args.concurrency),
+        full_details=args.full_details,
+        seed=args.seed
+    )
     
     try:
         if args.health:
             print("🔍 Checking Signal Agent health...")
-            is_healthy = problem_maker.check_agent_health()
+            is_healthy = await problem_maker.check_agent_health()
             print("✅ Signal Agent ready" if is_healthy else "❌ Signal Agent not ready")
             exit(0 if is_healthy else 1)
             
         elif args.demo:
             print("🔥 PROBLEM MAKER DEMO - ENHANCED EVENTS")
             print("=" * 60)
-            for i in range(5):
-                event = problem_maker.generate_event()
+            for i, event in enumerate(problem_maker.generate_events_batch(5)):
                 print(f"\n📋 Event {i+1}:")
                 print(f"ID: {event['event_id']} | Service: {event['service']} | Severity: {event['severity']}")
                 print(f"Message: {event['message']}")
                 print(f"Context: {event['details']['time_context']} | Users: {event['details']['affected_users']}")
                 await asyncio.sleep(1)
+        
+        elif args.benchmark:
+            start = time.perf_counter()
+            events = problem_maker.generate_events_batch(args.count)
+            elapsed = time.perf_counter() - start
+            rate = len(events) / elapsed if elapsed > 0 else float("inf")
+            print(f"⏱️ Generated {len(events)} events in {elapsed:.3f}s ({rate:,.0f} events/sec)")
         else:
             await problem_maker.generate_problem_stream(
                 count=args.count,
-                delay_seconds=args.delay
+                delay_seconds=args.delay,
+                batch_size=args.batch_size
             )
     except KeyboardInterrupt:
         print("\n🛑 Generation interrupted")
         problem_maker.stop_generation()
+    finally:
+        await problem_maker.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
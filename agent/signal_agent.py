@@ -15,22 +15,73 @@ Features:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import logging.handlers
+import multiprocessing
+import queue
+import socket
+import sys
 import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from operator import attrgetter
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Any, Dict, List, Optional, Literal, Union
-from pydantic import BaseModel, ValidationError, Field
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlparse
+from typing import Any, Coroutine, Dict, List, Mapping, Optional, Literal, Tuple, Union
+from pydantic import BaseModel, ConfigDict, ValidationError, Field
+
+import anyio
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 
 from mcp.client.stdio import stdio_client, StdioServerParameters
 from mcp.client.streamable_http import streamablehttp_client
 from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, TextContent
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Fast JSON when orjson is installed; stdlib fallback keeps the module importable
+try:
+    import orjson
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+    
+    def _json_dumps_sorted(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    _json_loads = json.loads
+    
+    def _json_dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), sort_keys=True, default=str).encode('utf-8')
+
+# Logging is configured by the entry point (main() / main.py), not at import
 logger = logging.getLogger(__name__)
 
+def _start_queued_logging() -> logging.handlers.QueueListener:
+    """Move the root log handlers behind a queue so callers never block on stream I/O."""
+    root = logging.getLogger()
+    # Queued records bypass logging.lastResort, so forward to it explicitly when nothing is configured
+    handlers = root.handlers or [h for h in (logging.lastResort,) if h is not None]
+    listener = logging.handlers.QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(listener.queue)]
+    listener.start()
+    return listener
+
+def _stop_queued_logging(listener: logging.handlers.QueueListener):
+    """Flush queued records and hand the original handlers back to the root logger."""
+    listener.stop()
+    logging.getLogger().handlers = [h for h in listener.handlers if h is not logging.lastResort]
+
 # =============================================================================
 # SCHEMA & MODELS
 # =============================================================================
@@ -44,9 +95,186 @@ class FailureEventInput(BaseModel):
     message: str = Field(..., min_length=1, max_length=1000)
     details: Dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        extra = "forbid"
-        str_strip_whitespace = True
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+# Interactive schema help - static, so the example JSON and text are built once
+_SCHEMA_EXAMPLE = {
+    "event_id": "sig_001_example",
+    "timestamp": "2025-06-08T10:30:00Z",
+    "service": "api-gateway",
+    "severity": "critical",
+    "message": "Service timeout - unable to process requests",
+    "details": {"error_code": "TIMEOUT", "affected_users": 25}
+}
+_SCHEMA_HELP = "\n".join([
+    "\n" + "="*60,
+    "EXPECTED JSON INPUT SCHEMA",
+    "="*60,
+    "Required fields:",
+    "• event_id (1-100 chars): Unique identifier",
+    "• timestamp: ISO 8601 format",
+    "• service (1-200 chars): Service/system name",
+    "• severity: 'critical', 'warning', or 'info'",
+    "• message (1-1000 chars): Failure description",
+    "• details (optional): Additional metadata",
+    f"\nExample:\n{json.dumps(_SCHEMA_EXAMPLE, indent=2)}",
+    "="*60 + "\n"
+])
+
+# Cheap structural prefilter, checked before full model validation of dict input
+_REQUIRED_FIELDS = ("event_id", "timestamp", "service", "severity", "message")
+_SEVERITIES = frozenset(("critical", "warning", "info"))
+# Argument names of the classify_failure_event tool
+_TOOL_ARG_KEYS = frozenset(_REQUIRED_FIELDS + ("details",))
+
+# Demo event shipped with the repo
+_TEST_PAYLOAD = Path(__file__).resolve().parent.parent / "events" / "test_payload.json"
+
+# Errors meaning the MCP transport is gone; the session is reopened once on these
+_TRANSPORT_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream,
+                     OSError, httpx.TransportError)
+
+# Hostnames that mean "this machine" for prefer_local
+_LOCAL_HOSTS = frozenset(("localhost", "127.0.0.1", "::1"))
+
+# Largest POST body the listener will read (1 MiB)
+_MAX_BODY = 1 << 20
+
+# Processed classify results are reused for identical events (retries, demo replays)
+_RESULT_CACHE_SIZE = 512
+_RESULT_CACHE_TTL = 60.0
+
+class _ListenerServer(uvicorn.Server):
+    """uvicorn server that sets an asyncio.Event once it is accepting connections."""
+    
+    def __init__(self, config: uvicorn.Config, ready: asyncio.Event):
+        super().__init__(config)
+        self._ready = ready
+    
+    async def startup(self, sockets: Optional[List[socket.socket]] = None):
+        await super().startup(sockets=sockets)
+        if self.started:
+            self._ready.set()
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """
+    Non-owning view of the agent's connection pool.
+    
+    MCP closes the httpx client it creates when a session ends; closing this view
+    leaves the pooled keep-alive connections open for the next session.
+    """
+    
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+    
+    async def aclose(self):
+        # Pool is owned (and closed) by SignalAgent.close()
+        pass
+
+class _LoopRunner:
+    """Minimal asyncio.Runner stand-in for Python 3.10: one private loop reused across run() calls."""
+    
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+    
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        return self._loop.run_until_complete(coro)
+    
+    def close(self):
+        try:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            self._loop.close()
+
+class _StdinReader:
+    """
+    One long-lived daemon thread reading stdin for every prompt.
+    
+    Lines are buffered until a prompt takes them, so a prompt that is cancelled
+    leaves no reader of its own behind to swallow the next line.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lines: "deque[str]" = deque()
+        self._eof = False
+        # (loop, future) of the prompt currently waiting for a line
+        self._waiter: Optional[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def _read(self):
+        while True:
+            try:
+                line = input()
+            except EOFError:
+                line = None
+            with self._lock:
+                if line is None:
+                    self._eof = True
+                else:
+                    self._lines.append(line)
+                waiter, self._waiter = self._waiter, None
+            if waiter is not None:
+                waiter[0].call_soon_threadsafe(self._wake, waiter[1])
+            if line is None:
+                return
+    
+    @staticmethod
+    def _wake(future: "asyncio.Future[None]"):
+        if not future.done():
+            future.set_result(None)
+    
+    async def readline(self, prompt: str) -> str:
+        print(prompt, end="", flush=True)
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._lines:
+                    return self._lines.popleft()
+                if self._eof:
+                    raise EOFError
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._read, daemon=True)
+                    self._thread.start()
+                future = loop.create_future()
+                self._waiter = (loop, future)
+            try:
+                await future
+            finally:
+                with self._lock:
+                    if self._waiter is not None and self._waiter[1] is future:
+                        self._waiter = None
+
+_stdin = _StdinReader()
+
+async def _ainput(prompt: str) -> str:
+    """
+    Awaitable input(): the line is read off the event loop so it keeps serving
+    the MCP session while the user types.
+    
+    Under asyncio.run(), Ctrl+C at a prompt arrives as task cancellation; it is
+    turned back into KeyboardInterrupt so the menus' exit paths still run.
+    """
+    try:
+        return await _stdin.readline(prompt)
+    except asyncio.CancelledError:
+        task = asyncio.current_task()
+        if task is not None and hasattr(task, "uncancel"):
+            task.uncancel()
+        raise KeyboardInterrupt from None
+
+# Text extraction per MCP content block type; anything else is rendered with str()
+_CONTENT_TEXT = {TextContent: attrgetter('text')}
+
+def _shard_text(content: Any) -> str:
+    """Text of one MCP content block - one dict lookup on the block's type."""
+    return _CONTENT_TEXT.get(type(content), str)(content)
 
 # =============================================================================
 # SIGNAL AGENT
@@ -65,14 +293,39 @@ class SignalAgent:
                  server_args: Optional[List[str]] = None, 
                  transport: str = "stdio",
                  server_url: str = "http://localhost:8000/mcp",
-                 listen_port: int = 8001):
-        """Initialize Signal Agent with MCP server connection parameters."""
+                 listen_port: int = 8001,
+                 reuse_port: bool = False,
+                 prefer_local: bool = False):
+        """
+        Initialize Signal Agent with MCP server connection parameters.
+        
+        With prefer_local, an http transport pointed at this host is swapped for
+        stdio: a co-located server gains nothing from HTTP framing and the
+        JSON-RPC-over-HTTP round trip.
+        """
+        if prefer_local and transport == "http" and urlparse(server_url).hostname in _LOCAL_HOSTS:
+            logger.info("Server URL %s is local - using stdio transport (prefer_local)", server_url)
+            transport = "stdio"
+        
         self.server_args = server_args or ["server/server.py"]
         self.transport = transport
         self.server_url = server_url
         self.listen_port = listen_port
+        # Share listen_port with other agent processes (--workers) via SO_REUSEPORT
+        self.reuse_port = reuse_port
         self.connected = False
         
+        # Persistent MCP session, owned by _hold_session while connected
+        self._session: Optional[ClientSession] = None
+        self._session_task: Optional[asyncio.Task] = None
+        self._session_closing: Optional[asyncio.Event] = None
+        # Serializes connect/reconnect so concurrent callers share one new session
+        self._connect_lock = asyncio.Lock()
+        # Server tool descriptions, listed alongside the connect health check
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        # Keep-alive pool shared by every streamable-http client (see _http_client_factory)
+        self._http_transport: Optional[httpx.AsyncHTTPTransport] = None
+        
         # Stdio server parameters
         self.server_params = StdioServerParameters(
             command=server_command,
@@ -80,180 +333,289 @@ class SignalAgent:
         )
         
         # HTTP listener state
-        self.http_server = None
-        self.http_thread = None
+        self.http_server: Optional[uvicorn.Server] = None
+        self._serve_task: Optional[asyncio.Task] = None
         self.listening = False
+        # Print per-event analysis banners; off while serving the HTTP listener
+        self._interactive = True
+        
+        # Bounded LRU of classify results: payload hash -> (expires_at, result)
+        self._result_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Event loop runner for synchronous callers (see run())
+        self._runner: Optional[Union["asyncio.Runner", _LoopRunner]] = None
 
     # =============================================================================
     # VALIDATION & UTILITIES
     # =============================================================================
 
-    def validate_event(self, event_input: Union[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def validate_event(self, event_input: Union[str, bytes, Dict[str, Any]]) -> Optional[Mapping[str, Any]]:
         """
-        Unified validation for both string JSON and dict inputs.
+        Unified validation for raw JSON (str/bytes) and dict inputs.
+        
+        Thin shim over the specialized entry points - callers that know their
+        input type should call validate_event_bytes/_str/_dict directly.
         
         Args:
-            event_input: Raw JSON string or dictionary
+            event_input: Raw JSON string/bytes or dictionary
             
         Returns:
-            Validated event data dict or None if validation fails
+            Read-only view of the validated event data, or None if validation fails
         """
+        if isinstance(event_input, str):
+            return self.validate_event_str(event_input)
+        if isinstance(event_input, bytes):
+            return self.validate_event_bytes(event_input)
+        return self.validate_event_dict(event_input)
+
+    def validate_event_bytes(self, body: bytes) -> Optional[Mapping[str, Any]]:
+        """Validate a raw JSON request body (HTTP listener path - logs only, never prints)."""
         try:
-            # Parse if string input
-            if isinstance(event_input, str):
-                try:
-                    event_data = json.loads(event_input)
-                except json.JSONDecodeError as e:
-                    logger.error(f"❌ Invalid JSON: {str(e)}")
-                    print(f"❌ JSON parsing failed: {str(e)}")
-                    return None
-            else:
-                event_data = event_input
-            
-            # Validate against schema
-            validated_event = FailureEventInput(**event_data)
-            logger.info(f"✅ Event validation passed: {validated_event.event_id}")
-            return validated_event.model_dump()
-            
+            # Raw JSON is parsed and validated in one pass by pydantic-core
+            validated_event = FailureEventInput.model_validate_json(body)
         except ValidationError as e:
-            logger.error(f"❌ Schema validation failed: {str(e)}")
-            if isinstance(event_input, str):  # Only print for interactive mode
+            self._log_validation_error(e)
+            return None
+        logger.debug("✅ Event validation passed: %s", validated_event.event_id)
+        # Fields are already plain validated values - hand back a read-only view of the
+        # model's own field dict rather than re-walking it with model_dump()
+        return MappingProxyType(validated_event.__dict__)
+
+    def validate_event_str(self, text: str) -> Optional[Mapping[str, Any]]:
+        """Validate JSON typed in interactive mode, printing errors for the user."""
+        try:
+            validated_event = FailureEventInput.model_validate_json(text)
+        except ValidationError as e:
+            errors = self._log_validation_error(e)
+            if errors[0]['type'] == 'json_invalid':
+                print(f"❌ JSON parsing failed: {errors[0]['msg']}")
+            else:
                 print("❌ Input validation failed:")
-                for error in e.errors():
+                for error in errors:
                     field = " -> ".join(str(x) for x in error['loc'])
                     print(f"   • {field}: {error['msg']}")
             return None
-        except Exception as e:
-            logger.error(f"❌ Validation error: {str(e)}")
+        logger.debug("✅ Event validation passed: %s", validated_event.event_id)
+        return MappingProxyType(validated_event.__dict__)
+
+    def validate_event_dict(self, event_input: Dict[str, Any]) -> Optional[Mapping[str, Any]]:
+        """Validate an already-decoded event (batch items, test payloads)."""
+        # Reject obviously malformed events without entering the full validator
+        if (not isinstance(event_input, dict)
+                or not all(key in event_input for key in _REQUIRED_FIELDS)
+                or not isinstance(event_input["severity"], str)
+                or event_input["severity"] not in _SEVERITIES):
+            logger.error("❌ Schema validation failed: missing required fields or unknown severity")
             return None
+        try:
+            validated_event = FailureEventInput.model_validate(event_input)
+        except ValidationError as e:
+            self._log_validation_error(e)
+            return None
+        logger.debug("✅ Event validation passed: %s", validated_event.event_id)
+        return MappingProxyType(validated_event.__dict__)
+
+    @staticmethod
+    def _log_validation_error(error: ValidationError) -> List[Dict[str, Any]]:
+        """Log a validation failure and return its error list."""
+        errors = error.errors()
+        if errors[0]['type'] == 'json_invalid':
+            logger.error("❌ Invalid JSON: %s", error)
+        else:
+            logger.error("❌ Schema validation failed: %s", error)
+        return errors
+
+    @staticmethod
+    def _content_text(contents: List[Any]) -> str:
+        """Concatenate the text of MCP content shards (fast path for the usual single shard)."""
+        if len(contents) == 1:
+            return _shard_text(contents[0])
+        return "".join(map(_shard_text, contents))
+
+    @classmethod
+    def _result_payload(cls, result: Any) -> Optional[Dict[str, Any]]:
+        """
+        JSON payload of a tool result: structuredContent when the server provides
+        it, otherwise the decoded text content (None when there is no text).
+        """
+        structured = getattr(result, 'structuredContent', None)
+        if isinstance(structured, dict):
+            return structured
+        if result and result.content:
+            response_text = cls._content_text(result.content)
+            # isspace() stops at the first non-blank character; strip() would copy
+            if response_text and not response_text.isspace():
+                return _json_loads(response_text)
+        return None
 
     def display_schema_help(self):
         """Display the expected JSON schema format."""
-        schema_example = {
-            "event_id": "sig_001_example",
-            "timestamp": "2025-06-08T10:30:00Z",
-            "service": "api-gateway",
-            "severity": "critical",
-            "message": "Service timeout - unable to process requests",
-            "details": {"error_code": "TIMEOUT", "affected_users": 25}
-        }
-        
-        print("\n" + "="*60)
-        print("EXPECTED JSON INPUT SCHEMA")
-        print("="*60)
-        print("Required fields:")
-        print("• event_id (1-100 chars): Unique identifier")
-        print("• timestamp: ISO 8601 format")
-        print("• service (1-200 chars): Service/system name") 
-        print("• severity: 'critical', 'warning', or 'info'")
-        print("• message (1-1000 chars): Failure description")
-        print("• details (optional): Additional metadata")
-        print(f"\nExample:\n{json.dumps(schema_example, indent=2)}")
-        print("="*60 + "\n")
+        print(_SCHEMA_HELP)
 
     # =============================================================================
     # HTTP LISTENER
     # =============================================================================
 
-    class EventHandler(BaseHTTPRequestHandler):
-        """HTTP request handler for receiving events."""
-        
-        def __init__(self, signal_agent, *args, **kwargs):
-            self.signal_agent = signal_agent
-            super().__init__(*args, **kwargs)
-        
-        def _send_json_response(self, status: int, data: Dict[str, Any]):
-            """Helper to send JSON responses."""
-            self.send_response(status)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(data).encode())
-        
-        def do_POST(self):
-            """Handle POST requests with event data."""
-            if self.path != '/events':
-                self.send_response(404)
-                self.end_headers()
-                return
-                
+    # Health responses only vary by MCP connection state - serialize both once
+    _HEALTH_BODIES = {
+        connected: _json_dumps({
+            "status": "healthy",
+            "service": "signal-agent",
+            "listening": True,
+            "mcp_connected": connected
+        })
+        for connected in (True, False)
+    }
+
+    @staticmethod
+    def _json_response(status: int, data: Dict[str, Any]) -> Response:
+        """Helper to build JSON responses."""
+        return Response(_json_dumps(data), status_code=status, media_type="application/json")
+
+    @staticmethod
+    def _raw_event_id(raw: Any) -> str:
+        """Best-effort event_id of an item that failed validation."""
+        event_id = raw.get("event_id") if isinstance(raw, dict) else None
+        return event_id if isinstance(event_id, str) else "unknown"
+
+    @staticmethod
+    def _summarize_result(event_id: str, result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the client-facing summary for one processed event."""
+        if result and result.get("status") == "processed":
+            return {
+                "status": "processed",
+                "event_id": event_id,
+                "classification": result.get('classification'),
+                "calculated_severity": result.get('calculated_severity'),
+                "recommendation": result.get('recommendation')
+            }
+        return {"status": "failed", "event_id": event_id, "error": "Event processing failed"}
+
+    async def _handle_post(self, request: Request) -> Response:
+        """Handle POST requests with single (/events) or batched (/events/batch) event data."""
+        handler = self._handle_event if request.url.path == '/events' else self._handle_batch
+        
+        try:
+            # Read request; handlers parse (single events validate straight from bytes)
             try:
-                # Read and parse request
-                content_length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(content_length).decode('utf-8')
-                event_data = json.loads(body)
-                
-                # Validate event
-                validated_event = self.signal_agent.validate_event(event_data)
-                if not validated_event:
-                    self._send_json_response(400, {"error": "Event validation failed"})
-                    return
+                declared_length = int(request.headers.get('content-length', 0))
+            except ValueError:
+                return self._json_response(400, {"error": "Invalid Content-Length"})
+            if declared_length > _MAX_BODY:
+                return self._json_response(413, {"error": "Request body too large"})
+            
+            # Content-Length may be absent (chunked) or wrong - enforce the cap while reading
+            chunks, size = [], 0
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > _MAX_BODY:
+                    return self._json_response(413, {"error": "Request body too large"})
+                chunks.append(chunk)
+            return await handler(b"".join(chunks))
                 
-                # Process event in new event loop
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    result = loop.run_until_complete(
-                        self.signal_agent.process_failure_event(validated_event)
-                    )
-                    
-                    if result and result.get("status") == "processed":
-                        self._send_json_response(200, {
-                            "status": "processed",
-                            "event_id": validated_event['event_id'],
-                            "classification": result.get('classification'),
-                            "calculated_severity": result.get('calculated_severity'),
-                            "recommendation": result.get('recommendation')
-                        })
-                    else:
-                        self._send_json_response(500, {"error": "Event processing failed"})
-                finally:
-                    loop.close()
-                    
-            except json.JSONDecodeError:
-                self._send_json_response(400, {"error": "Invalid JSON"})
-            except Exception as e:
-                logger.error(f"❌ Event processing error: {str(e)}")
-                self._send_json_response(500, {"error": str(e)})
-        
-        def do_GET(self):
-            """Handle GET requests for health checks."""
-            if self.path == '/health':
-                self._send_json_response(200, {
-                    "status": "healthy",
-                    "service": "signal-agent",
-                    "listening": True,
-                    "mcp_connected": self.signal_agent.connected
-                })
-            else:
-                self.send_response(404)
-                self.end_headers()
-        
-        def log_message(self, format, *args):
-            """Suppress HTTP server logs."""
-            pass
-
-    def start_http_listener(self):
-        """Start HTTP listener in background thread."""
-        def run_server():
-            self.http_server = HTTPServer(
-                ('localhost', self.listen_port),
-                lambda *args, **kwargs: SignalAgent.EventHandler(self, *args, **kwargs)
-            )
-            logger.info(f"🌐 HTTP listener started on http://localhost:{self.listen_port}")
-            self.listening = True
-            self.http_server.serve_forever()
+        except json.JSONDecodeError:
+            return self._json_response(400, {"error": "Invalid JSON"})
+        except Exception as e:
+            logger.error("❌ Event processing error: %s", e)
+            return self._json_response(500, {"error": str(e)})
+
+    async def _handle_event(self, body: bytes) -> Response:
+        """Validate and process a single event."""
+        validated_event = self.validate_event_bytes(body)
+        if not validated_event:
+            return self._json_response(400, {"error": "Event validation failed"})
+        
+        result = await self.process_failure_event(validated_event)
+        summary = self._summarize_result(validated_event['event_id'], result)
+        
+        if summary["status"] == "processed":
+            return self._json_response(200, summary)
+        return self._json_response(500, {"error": summary["error"]})
+
+    async def _handle_batch(self, body: bytes) -> Response:
+        """Validate and process a batch of events ({"events": [...]}) in one request."""
+        payload = _json_loads(body)
+        events = payload.get("events") if isinstance(payload, dict) else None
+        if not isinstance(events, list):
+            return self._json_response(400, {"error": "Batch must be an object with an 'events' list"})
+        
+        validated = [self.validate_event_dict(event) for event in events]
+        valid_events = [event for event in validated if event]
+        # One classify_failure_events_batch call for the whole request
+        results = iter(await self.process_failure_events(valid_events) if valid_events else [])
+        
+        # One summary per input item, in input order - rejected items get a failed entry
+        summaries = [
+            self._summarize_result(event['event_id'], next(results)) if event
+            else {"status": "failed", "event_id": self._raw_event_id(raw), "error": "Event validation failed"}
+            for raw, event in zip(events, validated)
+        ]
+        processed = sum(1 for summary in summaries if summary["status"] == "processed")
+        
+        return self._json_response(200, {
+            "status": "processed",
+            "received": len(events),
+            "processed": processed,
+            "failed": len(events) - processed,
+            "results": summaries
+        })
+
+    async def _handle_health(self, request: Request) -> Response:
+        """Handle GET requests for health checks."""
+        return Response(self._HEALTH_BODIES[bool(self.connected)], media_type="application/json")
+
+    async def start_http_listener(self) -> bool:
+        """
+        Start HTTP listener on the running event loop.
+        
+        uvicorn serves the listener on the same loop that holds the MCP session,
+        so request handlers await process_failure_event directly.
+        
+        Returns:
+            bool: True if the listener is accepting connections
+        """
+        app = Starlette(routes=[
+            Route('/events', self._handle_post, methods=['POST']),
+            Route('/events/batch', self._handle_post, methods=['POST']),
+            Route('/health', self._handle_health, methods=['GET'])
+        ])
+        
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            # Kernel load-balances connections across every process bound this way
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        try:
+            sock.bind(('localhost', self.listen_port))
+        except OSError as e:
+            sock.close()
+            logger.error("❌ HTTP listener failed to bind port %s: %s", self.listen_port, e)
+            return False
         
-        self.http_thread = threading.Thread(target=run_server, daemon=True)
-        self.http_thread.start()
+        config = uvicorn.Config(app, log_level="warning", access_log=False, lifespan="off")
+        ready = asyncio.Event()
+        self.http_server = _ListenerServer(config, ready)
+        self._serve_task = asyncio.create_task(self.http_server.serve(sockets=[sock]))
         
-        # Wait a moment for server to actually start
-        import time
-        time.sleep(0.5)
+        # Wait for startup to signal readiness, or for serve() to end early (startup failed)
+        ready_wait = asyncio.ensure_future(ready.wait())
+        await asyncio.wait((ready_wait, self._serve_task), return_when=asyncio.FIRST_COMPLETED)
+        ready_wait.cancel()
+        
+        self.listening = self.http_server.started
+        if self.listening:
+            logger.info("🌐 HTTP listener started on http://localhost:%s", self.listen_port)
+        return self.listening
 
-    def stop_http_listener(self):
+    async def stop_http_listener(self):
         """Stop HTTP listener."""
         if self.http_server:
-            self.http_server.shutdown()
+            self.http_server.should_exit = True
+            await asyncio.gather(self._serve_task, return_exceptions=True)
+            self.http_server = None
+            self._serve_task = None
             self.listening = False
             logger.info("🛑 HTTP listener stopped")
 
@@ -274,7 +636,13 @@ class SignalAgent:
             return
         
         # Start HTTP listener
-        self.start_http_listener()
+        if not await self.start_http_listener():
+            print(f"❌ Failed to start HTTP listener on port {self.listen_port}")
+            return
+        
+        # Keep the request path off stdout: no per-event banners, log records written by a background thread
+        self._interactive = False
+        log_listener = _start_queued_logging()
         
         # Now show ready message after server has started
         print(f"\n✅ HTTP listener active on port {self.listen_port}")
@@ -283,148 +651,393 @@ class SignalAgent:
         print("\n🎧 Waiting for events...")
         
         try:
-            while self.listening:
-                await asyncio.sleep(1)
+            # uvicorn handles Ctrl+C itself and returns once it has shut down
+            await self._serve_task
                 
         except KeyboardInterrupt:
             print("\n🛑 Stopping HTTP event listener...")
         finally:
-            self.stop_http_listener()
+            await self.stop_http_listener()
+            _stop_queued_logging(log_listener)
+            self._interactive = True
 
     # =============================================================================
     # MCP CONNECTION & SESSION MANAGEMENT
     # =============================================================================
 
     async def connect(self) -> bool:
-        """Establish connection with Signal Server and perform handshake."""
-        logger.info(f"Connecting to Signal Server via MCP {self.transport} protocol...")
+        """
+        Establish a persistent connection with Signal Server and perform handshake.
         
-        try:
-            if self.transport == "http":
-                async with streamablehttp_client(self.server_url) as session_context:
-                    return await self._initialize_session(session_context)
-            else:
-                async with stdio_client(self.server_params) as session_context:
-                    return await self._initialize_session(session_context)
-        except Exception as e:
-            self.connected = False
-            logger.error(f"❌ MCP connection failed: {str(e)}")
+        The MCP session is opened once and held by a background task until close(),
+        so every later tool call reuses it. Calling connect() again while connected
+        is a no-op.
+        """
+        async with self._connect_lock:
+            return await self._connect_locked()
+
+    async def _reconnect(self, dead_session: ClientSession) -> bool:
+        """
+        Replace a session whose transport died. Concurrent callers that saw the same
+        dead session wait on the lock, and only the first one opens a new session.
+        """
+        async with self._connect_lock:
+            if self._session is dead_session:
+                await self._close_session()
+            return await self._connect_locked()
+
+    async def _connect_locked(self) -> bool:
+        """Open the persistent session unless one is already open (caller holds _connect_lock)."""
+        if self._session is not None:
+            return self.connected
+        
+        logger.info("Connecting to Signal Server via MCP %s protocol...", self.transport)
+        
+        ready = asyncio.Event()
+        self._session_closing = asyncio.Event()
+        self._session_task = asyncio.create_task(self._hold_session(ready))
+        await ready.wait()
+        
+        if not self.connected:
+            await self._close_session()
             return False
+        return True
 
-    async def _initialize_session(self, session_context) -> bool:
-        """Initialize MCP session and verify server health."""
+    async def _hold_session(self, ready: asyncio.Event):
+        """
+        Own the transport and ClientSession contexts for the agent's lifetime.
+        
+        The handshake (initialize, then health check and tool listing together) runs
+        here before ready is set; an unhealthy server closes the session right away.
+        
+        The transports run anyio task groups, which must be exited by the task that
+        entered them - so the contexts are held here rather than on an exit stack on
+        the instance, where close() (possibly called from another task) would unwind it.
+        """
         try:
-            if self.transport == "http":
-                read_stream, write_stream, _ = session_context
-            else:
-                read_stream, write_stream = session_context
+            async with self._open_session() as session:
+                self._session = session
                 
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                
-                # Health check
-                result = await session.call_tool("health_check", {})
+                # Health check and tool listing are independent - overlap them in one round-trip
+                healthy, tools = await asyncio.gather(
+                    self._run_health_check_chain(session),
+                    self._fetch_tools(session),
+                    return_exceptions=True
+                )
+                if isinstance(tools, Exception):
+                    logger.warning("⚠️ Tool listing failed during connect: %s", tools)
                 
-                if result and result.content:
-                    response_text = "".join(
-                        content.text if hasattr(content, 'text') else str(content)
-                        for content in result.content
-                    )
-                    
-                    # Parse health response
-                    if response_text.strip():
-                        try:
-                            health_data = json.loads(response_text)
-                            if health_data.get("status") == "healthy":
-                                self.connected = True
-                                logger.info("✅ MCP connection established with Signal Server")
-                                return True
-                        except json.JSONDecodeError:
-                            if "healthy" in response_text.lower():
-                                self.connected = True
-                                logger.info("✅ MCP connection established with Signal Server")
-                                return True
-                    else:
-                        # Empty but successful response
-                        if not hasattr(result, 'isError'):
-                            self.connected = True
-                            logger.info("✅ MCP connection established")
-                            return True
+                ready.set()
+                if healthy is True:
+                    await self._session_closing.wait()
+        except Exception as e:
+            logger.error("❌ MCP connection failed: %s", e)
+        finally:
+            self._session = None
+            self.connected = False
+            ready.set()
+
+    @asynccontextmanager
+    async def _open_transport(self):
+        """Open the configured MCP transport, yielding its (read, write) streams."""
+        if self.transport == "http":
+            async with streamablehttp_client(
+                self.server_url, httpx_client_factory=self._http_client_factory
+            ) as (read_stream, write_stream, _):
+                yield read_stream, write_stream
+        else:
+            async with stdio_client(self.server_params) as (read_stream, write_stream):
+                yield read_stream, write_stream
+
+    def _http_client_factory(self, headers: Optional[Dict[str, str]] = None,
+                             timeout: Optional[httpx.Timeout] = None,
+                             auth: Optional[httpx.Auth] = None) -> httpx.AsyncClient:
+        """
+        httpx client factory for the streamable-http transport.
+        
+        Same defaults as MCP's own factory, but every client shares one agent-wide
+        keep-alive pool (Nagle off for the small JSON-RPC POSTs), so reconnects
+        reuse warm sockets instead of opening new ones.
+        """
+        if self._http_transport is None:
+            self._http_transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+                socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+            )
+        return httpx.AsyncClient(
+            transport=_SharedTransport(self._http_transport),
+            headers=headers,
+            timeout=timeout or httpx.Timeout(30.0),
+            auth=auth,
+            follow_redirects=True
+        )
+
+    @asynccontextmanager
+    async def _open_session(self):
+        """Open the configured transport and yield an initialized ClientSession on it."""
+        async with self._open_transport() as (read_stream, write_stream), \
+                ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            yield session
+
+    async def _close_session(self):
+        """Release the persistent MCP session, if one is open."""
+        if self._session_task is not None:
+            self._session_closing.set()
+            await self._session_task
+            self._session_task = None
+            self._tools_cache = None
+
+    async def _run_health_check_chain(self, session: ClientSession,
+                                      methods: Tuple[str, ...] = ("ping", "health_check"),
+                                      timeout: float = 5.0) -> bool:
+        """
+        Confirm the server is live, trying the cheapest check first.
+        
+        "ping" is the MCP protocol ping (no tool dispatch or JSON body),
+        "health_check" calls the server's health tool, and "skip" trusts the
+        initialize handshake alone. The first method that succeeds wins.
+        """
+        for method in methods:
+            if method == "ping":
+                try:
+                    await asyncio.wait_for(session.send_ping(), timeout)
+                except Exception as e:
+                    logger.warning("⚠️ MCP ping failed, trying next health check: %s", e)
+                    continue
+                self.connected = True
+                logger.info("✅ MCP connection established with Signal Server")
+                return True
+            if method == "health_check":
+                if await self._check_server_health():
+                    return True
+            elif method == "skip":
+                self.connected = True
+                return True
+        return False
+
+    async def _check_server_health(self) -> bool:
+        """Verify server health over the persistent MCP session."""
+        try:
+            # Health check
+            result = await self._session.call_tool("health_check", {})
+            structured = getattr(result, 'structuredContent', None)
+            
+            if isinstance(structured, dict):
+                # Already-parsed result from newer servers - no text to walk or decode
+                healthy = structured.get("status") == "healthy"
+            elif result and result.content:
+                response_text = self._content_text(result.content)
                 
-                logger.error("❌ Server handshake failed")
-                return False
+                # Parse health response once; non-JSON bodies fall back to a substring check
+                if response_text and not response_text.isspace():
+                    try:
+                        healthy = _json_loads(response_text).get("status") == "healthy"
+                    except json.JSONDecodeError:
+                        healthy = "healthy" in response_text.lower()
+                else:
+                    # Empty but successful response
+                    healthy = not hasattr(result, 'isError')
+            else:
+                healthy = False
+            
+            if healthy:
+                self.connected = True
+                logger.info("✅ MCP connection established with Signal Server")
+                return True
+            
+            logger.error("❌ Server handshake failed")
+            return False
                 
         except Exception as e:
-            logger.error(f"❌ Session initialization failed: {str(e)}")
+            logger.error("❌ Session initialization failed: %s", e)
             return False
 
+    @staticmethod
+    def _is_transport_error(error: Exception) -> bool:
+        """True when the MCP transport itself is gone (server exited, pipe or socket closed)."""
+        if isinstance(error, McpError):
+            return error.error.code == CONNECTION_CLOSED
+        return isinstance(error, _TRANSPORT_ERRORS)
+
     async def _execute_with_session(self, operation):
-        """Execute operation with appropriate MCP session."""
-        try:
-            if self.transport == "http":
-                async with streamablehttp_client(self.server_url) as session_context:
-                    read_stream, write_stream, _ = session_context
-                    async with ClientSession(read_stream, write_stream) as session:
-                        await session.initialize()
-                        return await operation(session)
-            else:
-                async with stdio_client(self.server_params) as session_context:
-                    read_stream, write_stream = session_context
-                    async with ClientSession(read_stream, write_stream) as session:
-                        await session.initialize()
-                        return await operation(session)
-        except Exception as e:
-            logger.error(f"❌ Session operation failed: {str(e)}")
+        """
+        Execute operation on the persistent MCP session, connecting first if needed.
+        
+        If the transport has gone away, the dead session is released and the
+        operation retried once on a fresh connection.
+        """
+        if self._session is None and not await self.connect():
+            logger.error("❌ Session operation failed: not connected to Signal Server")
             return None
+        
+        for attempt in range(2):
+            session = self._session
+            try:
+                return await operation(session)
+            except Exception as e:
+                if attempt or not self._is_transport_error(e):
+                    logger.error("❌ Session operation failed: %s", str(e) or type(e).__name__)
+                    return None
+                logger.warning("⚠️ MCP session lost (%s), reconnecting...", str(e) or type(e).__name__)
+                if not await self._reconnect(session):
+                    logger.error("❌ Session operation failed: not connected to Signal Server")
+                    return None
 
     # =============================================================================
     # CORE PROCESSING
     # =============================================================================
 
-    async def process_failure_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_failure_event(self, event_data: Mapping[str, Any]) -> Dict[str, Any]:
         """Process failure event through Signal Server analysis pipeline."""
         event_id = event_data.get('event_id', 'unknown')
-        logger.info(f"Processing failure event via MCP: {event_id}")
+        logger.info("Processing failure event via MCP: %s", event_id)
+        
+        # Validated events already have exactly the tool's argument shape - pass them through
+        if event_data.keys() == _TOOL_ARG_KEYS:
+            tool_args = event_data
+        else:
+            tool_args = {key: event_data.get(key) for key in _REQUIRED_FIELDS}
+            tool_args["details"] = event_data.get("details") or {}
+        
+        cache_key = self._result_cache_key(tool_args)
+        cached = self._cached_result(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logger.info("♻️ Reusing cached analysis for event: %s", event_id)
+            if self._interactive and "human_readable" in cached:
+                self._display_analysis_result(cached["human_readable"])
+            # Results are flat dicts - a shallow copy keeps callers from editing the cache
+            return dict(cached)
         
         async def process_operation(session):
-            tool_args = {
-                "event_id": event_data.get("event_id"),
-                "timestamp": event_data.get("timestamp"),
-                "service": event_data.get("service"),
-                "severity": event_data.get("severity"),
-                "message": event_data.get("message"),
-                "details": event_data.get("details", {})
-            }
-            
             result = await session.call_tool("classify_failure_event", tool_args)
             
-            if result and result.content:
-                response_text = "".join(
-                    content.text if hasattr(content, 'text') else str(content)
-                    for content in result.content
-                )
+            analysis_result = self._result_payload(result)
+            if analysis_result and analysis_result.get("status") == "processed":
+                logger.info("✅ Event analysis completed via MCP protocol")
                 
-                if response_text.strip():
-                    analysis_result = json.loads(response_text)
-                    if analysis_result.get("status") == "processed":
-                        logger.info("✅ Event analysis completed via MCP protocol")
-                        
-                        # Display summary if available
-                        if "human_readable" in analysis_result:
-                            self._display_analysis_result(analysis_result["human_readable"])
-                        
-                        return analysis_result
+                # Display summary if available (skipped under HTTP ingestion)
+                if self._interactive and "human_readable" in analysis_result:
+                    self._display_analysis_result(analysis_result["human_readable"])
+                
+                if cache_key is not None:
+                    self._store_result(cache_key, dict(analysis_result))
+                return analysis_result
             
             return {"error": "Processing failed", "status": "failed"}
         
         result = await self._execute_with_session(process_operation)
         return result or {"error": "Session error", "status": "failed", "event_id": event_id}
 
+    async def process_failure_events(self, events: List[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process several events in one MCP round trip via the server's
+        classify_failure_events_batch tool. Results come back in input order.
+        """
+        logger.info("Processing %d failure events via MCP batch call", len(events))
+        # Nested values must be plain dicts for the JSON-RPC encoder (validated events are read-only views)
+        batch_args = {"events": [
+            dict(event) if event.keys() == _TOOL_ARG_KEYS
+            else {**{key: event.get(key) for key in _REQUIRED_FIELDS}, "details": event.get("details") or {}}
+            for event in events
+        ]}
+        
+        async def batch_operation(session):
+            result = await session.call_tool("classify_failure_events_batch", batch_args)
+            payload = self._result_payload(result)
+            return payload.get("results") if payload else None
+        
+        results = await self._execute_with_session(batch_operation)
+        if not results or len(results) != len(events):
+            return [
+                {"error": "Batch processing failed", "status": "failed", "event_id": event.get('event_id', 'unknown')}
+                for event in events
+            ]
+        
+        if self._interactive:
+            for analysis_result in results:
+                if analysis_result.get("status") == "processed" and "human_readable" in analysis_result:
+                    self._display_analysis_result(analysis_result["human_readable"])
+        return results
+
+    async def process_failure_events_concurrent(self, events: List[Mapping[str, Any]],
+                                                max_in_flight: int = 16) -> List[Dict[str, Any]]:
+        """
+        Process several events concurrently over the one persistent MCP session.
+        
+        A slot is acquired before each task is created, so at most max_in_flight
+        classify calls (and tasks) exist at a time however long the list is;
+        results come back in input order.
+        """
+        # Connect once up front so the workers don't race to open their own sessions
+        if not await self.connect():
+            return [
+                {"error": "Session error", "status": "failed", "event_id": event.get('event_id', 'unknown')}
+                for event in events
+            ]
+        
+        semaphore = asyncio.Semaphore(max_in_flight)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(events)
+        
+        async def process(index, event):
+            try:
+                results[index] = await self.process_failure_event(event)
+            finally:
+                semaphore.release()
+        
+        tasks = []
+        for index, event in enumerate(events):
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(process(index, event)))
+        await asyncio.gather(*tasks)
+        return results
+
+    @staticmethod
+    def _result_cache_key(tool_args: Mapping[str, Any]) -> Optional[str]:
+        """
+        Stable digest of the tool arguments (key order and value types normalized),
+        or None when they can't be serialized in a stable order - that call is not cached.
+        """
+        try:
+            return hashlib.blake2b(_json_dumps_sorted(dict(tool_args)), digest_size=16).hexdigest()
+        except TypeError:
+            return None
+
+    def _cached_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a live cached result for key, dropping it if expired."""
+        entry = self._result_cache.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self._result_cache.move_to_end(key)
+                self._cache_hits += 1
+                return result
+            del self._result_cache[key]
+        self._cache_misses += 1
+        return None
+
+    def _store_result(self, key: str, result: Dict[str, Any]):
+        """Cache a processed result, evicting the least recently used entry when full."""
+        self._result_cache[key] = (time.monotonic() + _RESULT_CACHE_TTL, result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the classify result cache."""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "size": len(self._result_cache),
+            "max_size": _RESULT_CACHE_SIZE,
+            "ttl_seconds": _RESULT_CACHE_TTL,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0
+        }
+
     def _display_analysis_result(self, summary: str):
         """Display formatted analysis result."""
-        print(f"\n{'='*60}\nSIGNAL ANALYSIS RESULT\n{'='*60}")
-        print(summary)
-        print("="*60 + "\n")
+        sys.stdout.write(f"\n{'='*60}\nSIGNAL ANALYSIS RESULT\n{'='*60}\n{summary}\n{'='*60}\n\n")
 
     # =============================================================================
     # INTERACTIVE MODES
@@ -444,7 +1057,7 @@ class SignalAgent:
         
         while True:
             try:
-                command = input("\n🔍 Enter command (1-5 or name): ").strip().lower()
+                command = (await _ainput("\n🔍 Enter command (1-5 or name): ")).strip().lower()
                 
                 if command in ['exit', '5']:
                     print("👋 Exiting database tools testing...")
@@ -458,18 +1071,18 @@ class SignalAgent:
                 elif command in ['today', '1']:
                     await self._test_query_events_today()
                 elif command in ['summary', '2']:
-                    days = input("Enter number of days (default 1): ").strip()
+                    days = (await _ainput("Enter number of days (default 1): ")).strip()
                     try:
                         days = int(days) if days else 1
                     except ValueError:
                         days = 1
                     await self._test_query_events_summary(days)
                 elif command in ['service', '3']:
-                    service = input("Enter service name: ").strip()
+                    service = (await _ainput("Enter service name: ")).strip()
                     if not service:
                         print("❌ Service name is required")
                         continue
-                    days = input("Enter number of days (default 7): ").strip()
+                    days = (await _ainput("Enter number of days (default 7): ")).strip()
                     try:
                         days = int(days) if days else 7
                     except ValueError:
@@ -482,7 +1095,7 @@ class SignalAgent:
                 print("\n👋 Exiting database tools testing...")
                 break
             except Exception as e:
-                logger.error(f"❌ Command error: {str(e)}")
+                logger.error("❌ Command error: %s", e)
                 print(f"❌ Error: {str(e)}")
 
     async def _test_query_events_today(self):
@@ -496,13 +1109,9 @@ class SignalAgent:
         result = await self._execute_with_session(tool_operation)
 
         if result and result.content:
-            response_text = "".join(
-                content.text if hasattr(content, 'text') else str(content)
-                for content in result.content
-            )
-            
             try:
-                data = json.loads(response_text)
+                # Single extraction + parse (or the server's structuredContent)
+                data = self._result_payload(result) or {}
                 print(f"\n📊 TODAY'S EVENTS SUMMARY:")
                 print(f"Total events today: {data.get('events_today', 0)}")
                 
@@ -523,7 +1132,7 @@ class SignalAgent:
                     print("\n📋 No events found for today")
                     
             except json.JSONDecodeError:
-                print(f"Raw response: {response_text}")
+                print(f"Raw response: {self._content_text(result.content)}")
         else:
             print("❌ No response from server")
 
@@ -537,13 +1146,9 @@ class SignalAgent:
         
         result = await self._execute_with_session(tool_operation)
         if result and result.content:
-            response_text = "".join(
-                content.text if hasattr(content, 'text') else str(content)
-                for content in result.content
-            )
-            
             try:
-                data = json.loads(response_text)
+                # Single extraction + parse (or the server's structuredContent)
+                data = self._result_payload(result) or {}
                 summary = data.get('summary', {})
                 
                 print(f"\n📊 SUMMARY FOR {data.get('period', f'last {days} day(s)')}:")
@@ -560,7 +1165,7 @@ class SignalAgent:
                         print(f"   {service.get('service', 'unknown')}: {service.get('event_count', 0)} events")
                         
             except json.JSONDecodeError:
-                print(f"Raw response: {response_text}")
+                print(f"Raw response: {self._content_text(result.content)}")
         else:
             print("❌ No response from server")
 
@@ -577,13 +1182,9 @@ class SignalAgent:
         
         result = await self._execute_with_session(tool_operation)
         if result and result.content:
-            response_text = "".join(
-                content.text if hasattr(content, 'text') else str(content)
-                for content in result.content
-            )
-            
             try:
-                data = json.loads(response_text)
+                # Single extraction + parse (or the server's structuredContent)
+                data = self._result_payload(result) or {}
                 
                 print(f"\n📊 EVENTS FOR SERVICE: {data.get('service', service)}")
                 print(f"Period: {data.get('period', f'last {days} day(s)')}")
@@ -602,47 +1203,54 @@ class SignalAgent:
                     print(f"\n📋 No events found for service '{service}'")
                     
             except json.JSONDecodeError:
-                print(f"Raw response: {response_text}")
+                print(f"Raw response: {self._content_text(result.content)}")
         else:
             print("❌ No response from server")
     # =============================================================================
     # TOOLS & DEMO
     # =============================================================================
 
-    async def get_server_tools(self) -> List[Dict[str, Any]]:
-        """Get and display available tools from the MCP server."""
-        logger.info("Fetching available tools from server...")
+    async def get_server_tools(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get and display available tools from the MCP server.
         
-        async def tools_operation(session):
-            tools_result = await session.list_tools()
-            
-            if tools_result and tools_result.tools:
-                tools_list = []
-                for tool in tools_result.tools:
-                    tools_list.append({
-                        "name": tool.name,
-                        "description": tool.description,
-                        "input_schema": getattr(tool, 'inputSchema', {})
-                    })
-                
-                self._display_tools(tools_list)
-                return tools_list
-            
-            logger.warning("⚠️ No tools returned from server")
-            return []
+        Tools are listed once per session (during connect) and served from that
+        cache; force_refresh re-queries the server.
+        """
+        tools_list = None if force_refresh else self._tools_cache
+        if tools_list is None:
+            logger.info("Fetching available tools from server...")
+            tools_list = await self._execute_with_session(self._fetch_tools) or []
         
-        return await self._execute_with_session(tools_operation) or []
+        if tools_list:
+            self._display_tools(tools_list)
+        else:
+            logger.warning("⚠️ No tools returned from server")
+        return tools_list
+
+    async def _fetch_tools(self, session: ClientSession) -> List[Dict[str, Any]]:
+        """List the server's tools, caching them for the life of the session."""
+        tools_result = await session.list_tools()
+        self._tools_cache = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": getattr(tool, 'inputSchema', {})
+            }
+            for tool in (tools_result.tools if tools_result else ())
+        ]
+        return self._tools_cache
 
     def _display_tools(self, tools: List[Dict[str, Any]]):
         """Display available tools."""
-        print(f"\n{'='*70}\nAVAILABLE SIGNAL SERVER TOOLS\n{'='*70}")
+        lines = [f"\n{'='*70}\nAVAILABLE SIGNAL SERVER TOOLS\n{'='*70}"]
         
         for i, tool in enumerate(tools, 1):
-            print(f"\n🔧 Tool {i}: {tool['name']}")
-            print(f"   Description: {tool['description']}")
+            lines.append(f"\n🔧 Tool {i}: {tool['name']}")
+            lines.append(f"   Description: {tool['description']}")
             
             if tool.get('input_schema', {}).get('properties'):
-                print("   Parameters:")
+                lines.append("   Parameters:")
                 properties = tool['input_schema']['properties']
                 required = tool['input_schema'].get('required', [])
                 
@@ -650,34 +1258,33 @@ class SignalAgent:
                     param_type = param_info.get('type', 'unknown')
                     param_desc = param_info.get('description') or param_info.get('title', 'No description')
                     required_marker = " (required)" if param_name in required else ""
-                    print(f"     • {param_name} ({param_type}){required_marker}: {param_desc}")
+                    lines.append(f"     • {param_name} ({param_type}){required_marker}: {param_desc}")
         
-        print("="*70 + "\n")
+        lines.append("="*70 + "\n")
+        # One write for the whole listing rather than a print (and stdout lock) per line
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    async def load_test_event(self, file_path: Path = _TEST_PAYLOAD) -> Optional[Mapping[str, Any]]:
+        """Load and validate a test event from disk, reading the file off the event loop."""
+        try:
+            data = await asyncio.to_thread(Path(file_path).read_bytes)
+            return self.validate_event_bytes(data)
+        except OSError as e:
+            logger.error("❌ Failed to read test event %s: %s", file_path, e)
+            return None
 
     async def run_demo(self):
         """Execute demo with test event."""
-        logger.info(f"🚀 Running Signal Agent Demo ({self.transport} transport)")
+        logger.info("🚀 Running Signal Agent Demo (%s transport)", self.transport)
         
         if not await self.connect():
             logger.error("Demo failed - cannot establish MCP connection")
             return
         
-        # Test event
-        test_event = {
-            "event_id": "sig_001_db_failure",
-            "timestamp": "2025-05-29T14:30:45Z",
-            "service": "user-authentication-service",
-            "severity": "critical",
-            "message": "PostgreSQL connection pool exhausted - unable to serve authentication requests",
-            "details": {
-                "database": "auth_db",
-                "connection_pool_size": 10,
-                "active_connections": 10,
-                "queue_length": 47,
-                "error_code": "POOL_EXHAUSTED",
-                "estimated_affected_users": 150
-            }
-        }
+        test_event = await self.load_test_event()
+        if not test_event:
+            logger.error("Demo failed - could not load test event")
+            return
         
         result = await self.process_failure_event(test_event)
         
@@ -702,7 +1309,7 @@ class SignalAgent:
 
     async def run_interactive(self):
         """Run interactive menu mode."""
-        logger.info(f"🚀 Starting Signal Agent Interactive Mode ({self.transport} transport)")
+        logger.info("🚀 Starting Signal Agent Interactive Mode (%s transport)", self.transport)
         
         if not await self.connect():
             print("❌ Failed to connect to server. Please ensure server is running.")
@@ -712,7 +1319,7 @@ class SignalAgent:
             self.show_menu()
             
             try:
-                choice = input("\n👉 Select option (1-5): ").strip()
+                choice = (await _ainput("\n👉 Select option (1-5): ")).strip()
                 
                 if choice == "1":
                     print("\n🔄 Running demo...")
@@ -736,23 +1343,81 @@ class SignalAgent:
                 print("\n👋 Exiting Signal Agent...")
                 break
             except Exception as e:
-                logger.error(f"❌ Menu error: {str(e)}")
+                logger.error("❌ Menu error: %s", e)
                 print(f"❌ Error: {str(e)}")
 
     async def close(self):
         """Clean up resources."""
-        self.stop_http_listener()
+        await self.stop_http_listener()
+        await self._close_session()
+        if self._http_transport is not None:
+            await self._http_transport.aclose()
+            self._http_transport = None
         self.connected = False
         logger.info("Signal Agent resources cleaned up")
 
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run one of the agent's coroutines from synchronous code.
+        
+        Every call reuses one asyncio.Runner loop (a private event loop on 3.10),
+        so the persistent MCP session opened by an earlier call stays alive for the
+        next one instead of being torn down with a per-call asyncio.run() loop.
+        Finish with run_close().
+        """
+        if self._runner is None:
+            self._runner = asyncio.Runner() if hasattr(asyncio, "Runner") else _LoopRunner()
+        return self._runner.run(coro)
+
+    def run_close(self):
+        """Close the agent on its runner loop, then close the loop itself."""
+        if self._runner is not None:
+            self._runner.run(self.close())
+            self._runner.close()
+            self._runner = None
+
+    async def __aenter__(self) -> "SignalAgent":
+        """Open the persistent MCP session for an `async with SignalAgent(...)` block."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Release the listener and MCP session when the block exits."""
+        await self.close()
+
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
 
+def install_uvloop():
+    """Use uvloop's event loop when it is installed (speedups extra); stdlib asyncio otherwise."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+def _run_listener_worker(transport: str, server_url: str, listen_port: int):
+    """Entry point for extra --workers processes: one agent and HTTP listener on the shared port."""
+    logging.basicConfig(level=logging.INFO)
+    
+    async def run():
+        async with SignalAgent(transport=transport, server_url=server_url,
+                               listen_port=listen_port, reuse_port=True) as agent:
+            await agent.listen_for_http_events()
+    
+    install_uvloop()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
 async def main():
     """Main entry point for standalone execution."""
     import argparse
     
+    logging.basicConfig(level=logging.INFO)
+    
     parser = argparse.ArgumentParser(description="Signal Agent - Dual Transport MCP Client")
     parser.add_argument("--transport", choices=["stdio", "http"], default="stdio")
     parser.add_argument("--server-url", default="http://localhost:8000/mcp")
@@ -760,13 +1425,17 @@ async def main():
     parser.add_argument("--demo", action="store_true", help="Run demo directly")
     parser.add_argument("--listen", action="store_true", help="Manual event listener")
     parser.add_argument("--http-listen", action="store_true", help="HTTP event listener")
+    parser.add_argument("--workers", type=int, default=1, help="HTTP listener processes sharing --listen-port")
+    parser.add_argument("--prefer-local", action="store_true", help="Use stdio when --server-url is this host")
     
     args = parser.parse_args()
     
     agent = SignalAgent(
         transport=args.transport, 
         server_url=args.server_url,
-        listen_port=args.listen_port
+        listen_port=args.listen_port,
+        reuse_port=args.workers > 1,
+        prefer_local=args.prefer_local
     )
     
     try:
@@ -778,11 +1447,30 @@ async def main():
             else:
                 print("❌ Failed to connect to server")
         elif args.http_listen:
-            await agent.listen_for_http_events()
+            # Extra workers each hold their own MCP session; this process is worker #1
+            workers = [
+                multiprocessing.Process(
+                    target=_run_listener_worker,
+                    args=(agent.transport, args.server_url, args.listen_port)
+                )
+                for _ in range(args.workers - 1)
+            ]
+            for worker in workers:
+                worker.start()
+            try:
+                await agent.listen_for_http_events()
+            finally:
+                for worker in workers:
+                    worker.terminate()
+                    worker.join()
         else:
             await agent.run_interactive()
     finally:
         await agent.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    install_uvloop()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
\ No newline at end of file
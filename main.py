@@ -23,7 +23,7 @@ import argparse
 import subprocess
 import os
 
-from agent.signal_agent import SignalAgent
+from agent.signal_agent import SignalAgent, install_uvloop
 from server.server import SignalServer
 
 # Configure system-wide logging
@@ -271,10 +271,10 @@ async def run_problem_maker_only(count: int = 20, delay: float = 1.5, agent_url:
     logger.info("⚠️  Ensure Signal Agent HTTP listener is running (menu option 4)")
     
     try:
-        # Use subprocess to mimic exact command: python agent/problem_maker.py
+        # Use subprocess to mimic exact command: python agent/chaos_agent.py
         cmd = [
             sys.executable,
-            os.path.join("agent", "problem_maker.py"),
+            os.path.join("agent", "chaos_agent.py"),
             f"--count={count}",
             f"--delay={delay}",
             f"--agent-url={agent_url}"
@@ -341,6 +341,9 @@ def main():
     
     args = parser.parse_args()
     
+    # libuv event loop for the MCP socket/pipe I/O when uvloop is installed (speedups extra)
+    install_uvloop()
+    
     # Display startup banner
     print("🚨 Signal System - Intelligent MCP-based Failure Event Processing")
     print("="*70)
@@ -72,11 +72,11 @@ class EventDatabase:
                     analysis_result.get('processed_at')
                 ))
                 conn.commit()
-                logger.info(f"✅ Stored event: {event_data.get('event_id')}")
+                logger.info("✅ Stored event: %s", event_data.get('event_id'))
                 return True
                 
         except Exception as e:
-            logger.error(f"❌ Failed to store event: {str(e)}")
+            logger.error("❌ Failed to store event: %s", e)
             return False
     
     def query_events_today(self) -> List[Dict[str, Any]]:
@@ -28,8 +28,7 @@ from mcp.types import TextContent, Tool
 # database imports
 from database import EventDatabase
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the entry point (main() / main.py), not at import
 logger = logging.getLogger(__name__)
 
 # database instance
@@ -57,6 +56,10 @@ class FailureEventParameters(BaseModel):
     message: str = Field(..., description="Human-readable description of the failure")
     details: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata and context")
 
+class FailureEventsBatchParameters(BaseModel):
+    """Input schema for classify_failure_events_batch tool."""
+    events: List[FailureEventParameters] = Field(..., description="Failure events to classify in one call")
+
 class HealthCheckInput(BaseModel):
     """Input schema for health_check tool."""
     # No parameters needed - health check is parameter-free
@@ -186,7 +189,7 @@ async def process_failure_event(event_id: str, timestamp: str, service: str,
             details=details or {}
         )
         
-        logger.info(f"Processing event: {event.event_id} ({event.service})")
+        logger.info("Processing event: %s (%s)", event.event_id, event.service)
         
         # Analyze event through centralized engine (existing code)
         result = await FailureAnalyzer.analyze_event(event)
@@ -203,21 +206,41 @@ async def process_failure_event(event_id: str, timestamp: str, service: str,
         
         storage_success = db.store_event(event_data, result)
         if storage_success:
-            logger.info(f"✅ Event stored in database: {event.event_id}")
+            logger.info("✅ Event stored in database: %s", event.event_id)
         else:
-            logger.warning(f"⚠️ Database storage failed for: {event.event_id}")
+            logger.warning("⚠️ Database storage failed for: %s", event.event_id)
         
-        logger.info(f"Analysis complete: {event.event_id} -> {result['classification']} ({result['calculated_severity']})")
+        logger.info("Analysis complete: %s -> %s (%s)", event.event_id, result['classification'], result['calculated_severity'])
         return result
         
     except Exception as e:
-        logger.error(f"Event processing failed: {str(e)}")
+        logger.error("Event processing failed: %s", e)
         return {
             "error": str(e),
             "status": "failed",
             "event_id": event_id
         }
 
+async def process_failure_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Batch variant of process_failure_event used by both transports.
+    
+    Each event goes through the same analysis and storage path; one tool call
+    returns every result, in input order.
+    """
+    results = [
+        await process_failure_event(*(event.get(key) for key in _EVENT_KEYS), event.get("details", {}))
+        for event in events
+    ]
+    processed = sum(1 for result in results if result.get("status") == "processed")
+    logger.info("Batch complete: %d/%d events processed", processed, len(results))
+    return {
+        "status": "processed",
+        "count": len(results),
+        "processed": processed,
+        "results": results
+    }
+
 async def health_check() -> Dict[str, Any]:
     """Health check function used by both transports."""
     return {
@@ -226,6 +249,49 @@ async def health_check() -> Dict[str, Any]:
         "message": "Signal server operational"
     }
 
+# Positional fields of process_failure_event, ahead of details
+_EVENT_KEYS = ("event_id", "timestamp", "service", "severity", "message")
+
+def _compact_json(result: Dict[str, Any]) -> str:
+    """Serialize a tool result without indentation - query results carry whole event lists."""
+    return json.dumps(result, separators=(',', ':'))
+
+# Tool registry for the stdio server - JSON schemas are generated once at import
+# rather than on every list_tools request
+STDIO_TOOLS = [
+    Tool(
+        name="classify_failure_event",
+        description="Analyze and classify failure events with intelligent recommendations",
+        inputSchema=FailureEventParameters.model_json_schema()
+    ),
+    Tool(
+        name="classify_failure_events_batch",
+        description="Analyze and classify several failure events in a single call",
+        inputSchema=FailureEventsBatchParameters.model_json_schema()
+    ),
+    Tool(
+        name="health_check",
+        description="Server health and status verification",
+        inputSchema=HealthCheckInput.model_json_schema()
+    ),
+    # *** NEW DATABASE QUERY TOOLS ***
+    Tool(
+        name="query_events_today",
+        description="Get all events from today with basic analysis",
+        inputSchema=QueryEventsTodayInput.model_json_schema()
+    ),
+    Tool(
+        name="query_events_summary",
+        description="Get summary statistics for recent events",
+        inputSchema=QueryEventsSummaryInput.model_json_schema()
+    ),
+    Tool(
+        name="query_events_by_service",
+        description="Get recent events for a specific service",
+        inputSchema=QueryEventsByServiceInput.model_json_schema()
+    )
+]
+
 # =============================================================================
 # STDIO TRANSPORT IMPLEMENTATION  
 # =============================================================================
@@ -238,66 +304,29 @@ async def serve_stdio() -> None:
     @server.list_tools()
     async def list_tools() -> List[Tool]:
         """List available tools with schemas."""
-        return [
-            Tool(
-                name="classify_failure_event",
-                description="Analyze and classify failure events with intelligent recommendations",
-                inputSchema=FailureEventParameters.model_json_schema()
-            ),
-            Tool(
-                name="health_check",
-                description="Server health and status verification",
-                inputSchema=HealthCheckInput.model_json_schema()
-            ),
-            # *** NEW DATABASE QUERY TOOLS ***
-            Tool(
-                name="query_events_today",
-                description="Get all events from today with basic analysis",
-                inputSchema=QueryEventsTodayInput.model_json_schema()
-            ),
-            Tool(
-                name="query_events_summary",
-                description="Get summary statistics for recent events",
-                inputSchema=QueryEventsSummaryInput.model_json_schema()
-            ),
-            Tool(
-                name="query_events_by_service",
-                description="Get recent events for a specific service",
-                inputSchema=QueryEventsByServiceInput.model_json_schema()
-            )
-        ]
+        return STDIO_TOOLS
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> List[TextContent]:
         """Handle tool calls with unified processing."""
         try:
             if name == "classify_failure_event":
-                # Handle both legacy and current parameter formats
-                if "event_data" in arguments:
-                    # Legacy format - parse JSON string
-                    event_dict = json.loads(arguments["event_data"])
-                    result = await process_failure_event(
-                        event_dict.get("event_id"),
-                        event_dict.get("timestamp"), 
-                        event_dict.get("service"),
-                        event_dict.get("severity"),
-                        event_dict.get("message"),
-                        event_dict.get("details", {})
-                    )
-                else:
-                    # Current format - direct parameters
-                    result = await process_failure_event(
-                        arguments.get("event_id"),
-                        arguments.get("timestamp"),
-                        arguments.get("service"), 
-                        arguments.get("severity"),
-                        arguments.get("message"),
-                        arguments.get("details", {})
-                    )
+                # Handle both legacy (JSON string in event_data) and current (direct) parameter formats
+                source = json.loads(arguments["event_data"]) if "event_data" in arguments else arguments
+                result = await process_failure_event(
+                    *(source.get(key) for key in _EVENT_KEYS),
+                    source.get("details", {})
+                )
+                return [TextContent(type="text", text=_compact_json(result))]
+                
+            elif name == "classify_failure_events_batch":
+                result = await process_failure_events(arguments.get("events") or [])
+                return [TextContent(type="text", text=_compact_json(result))]
                 
             elif name == "health_check":
                 result = await health_check()
                 result["transport"] = "stdio"
+                return [TextContent(type="text", text=_compact_json(result))]
 
             # *** DATABASE QUERY TOOLS ***
             elif name == "query_events_today":
@@ -310,7 +339,7 @@ async def serve_stdio() -> None:
                     "events": events[:10] if len(events) > 10 else events,  # Limit to 10 for readability
                     "showing": "latest 10" if len(events) > 10 else "all events"
                 }
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=_compact_json(result))]
                 
             elif name == "query_events_summary":
                 days = arguments.get("days", 1)
@@ -320,7 +349,7 @@ async def serve_stdio() -> None:
                     "period": f"last {days} day(s)",
                     "summary": summary
                 }
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=_compact_json(result))]
                 
             elif name == "query_events_by_service":
                 service = arguments.get("service")
@@ -337,15 +366,15 @@ async def serve_stdio() -> None:
                     "event_count": len(events),
                     "events": events
                 }
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [TextContent(type="text", text=_compact_json(result))]
                 
             else:
                 raise ValueError(f"Unknown tool: {name}")
             
         except Exception as e:
-            logger.error(f"Tool execution failed: {str(e)}")
+            logger.error("Tool execution failed: %s", e)
             error_result = {"error": str(e), "status": "failed"}
-            return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+            return [TextContent(type="text", text=_compact_json(error_result))]
 
     # Run server
     options = server.create_initialization_options()
@@ -380,6 +409,16 @@ def serve_http_sync() -> None:
         # Use the shared process_failure_event function that has database storage
         return await process_failure_event(event_id, timestamp, service, severity, message, details)
 
+    @mcp.tool()
+    async def classify_failure_events_batch(events: List[dict]) -> dict:
+        """
+        Analyze and classify several failure events in a single call.
+        
+        Each event takes the classify_failure_event fields; results are returned
+        in input order.
+        """
+        return await process_failure_events(events)
+
     @mcp.tool()
     async def health_check() -> dict:
         """Server health and status verification for monitoring and connectivity testing."""
@@ -501,6 +540,8 @@ def main():
     """Main entry point for standalone execution."""
     import argparse
     
+    logging.basicConfig(level=logging.INFO)
+    
     parser = argparse.ArgumentParser(description="Signal Server - Dual Transport MCP Server")
     parser.add_argument("--transport", choices=["stdio", "http", "streamable-http"], 
                        default="stdio", help="Transport mode")